@@ -8,7 +8,6 @@ import numpy as np
 import streamlit as st
 from datetime import datetime, timedelta
 from config.defaults import PRAEDIGENE_DEFAULTS, FINANCIAL_DEFAULTS
-import plotly.express as px
 import plotly.graph_objects as go
 import sys
 from pathlib import Path
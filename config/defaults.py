@@ -279,4 +279,26 @@ PARAMETER_IMPACT = {
     "high": ["adr_cost", "treatment_cost", "implementation_cost", "patient_impact", "cost_per_hai", "hai_incidence_rate"],
     "medium": ["fte_daily_cost", "annual_maintenance", "treatment_success", "readmission_rate", "dot_reduction_target"],
     "low": ["staff_training", "tech_time", "patient_benefit", "rerun_cost", "automation_efficiency"]
-}
\ No newline at end of file
+}
+
+# Columns and dtypes read from each VISN21 sample data file; everything else
+# is skipped. Shared by the data loader and the data viewer
+VISN21_CSV_SCHEMAS = {
+    'visn21_patient_bed_days.csv': {
+        'facility': 'category',
+        'facility_code': 'category',
+        'bed_days_annual': 'int32'
+    },
+    'visn21_hai_rates.csv': {
+        'facility': 'category',
+        'hai_type': 'category',
+        'rolling_12_months_rate': 'float32',
+        'unit_of_measure': 'category'
+    },
+    'visn21_antibiotic_dot.csv': {
+        'facility': 'category',
+        'quarter': 'category',
+        'year': 'int16',
+        'dot_per_1000_days': 'float32'
+    }
+}
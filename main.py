@@ -15,8 +15,7 @@ from datetime import datetime
 sys.path.append(str(Path(__file__).parent))
 
 from config.defaults import BITSCOPIC_COLORS, PRAEDIGENE_DEFAULTS, PRAEDIALERT_DEFAULTS, FINANCIAL_DEFAULTS
-from ui.styles import load_css
-from ui.enhanced_accessibility_styles import load_enhanced_css
+from ui.enhanced_accessibility_styles import load_enhanced_css, load_table_css, load_chart_css
 from ui.dashboard import show_dashboard
 from calculators.praedigene_calculator import PraediGeneCalculator
 from calculators.praedialert_calculator import PraediAlertCalculator
@@ -34,7 +33,7 @@ st.set_page_config(
 )
 
 # Force light theme for native charts
-st.markdown("""
+st.html("""
 <style>
     /* Override Streamlit's native chart dark theme */
     [data-testid="stVegaLiteChart"] {
@@ -50,7 +49,7 @@ st.markdown("""
         background-color: white !important;
     }
 </style>
-""", unsafe_allow_html=True)
+""")
 
 def initialize_session_state():
     """Initialize session state variables"""
@@ -345,8 +344,14 @@ def main():
     if not st.session_state.product_selection:
         show_product_selection()
     elif not st.session_state.organization_type:
+        # Custom data upload previews its file in a dataframe
+        load_table_css()
         show_organization_setup()
     else:
+        # Dashboard views render both tables and Plotly charts
+        load_table_css()
+        load_chart_css()
+        
         # Calculate ROI based on product selection
         if st.session_state.product_selection == 'praedigene':
             calculator = PraediGeneCalculator(st.session_state.organization_type)
@@ -3,24 +3,250 @@ Data Viewer for ROI Calculator
 Displays loaded CSV data in accessible format
 """
 
+import os
+import hashlib
+import tempfile
 import streamlit as st
 import pandas as pd
+from functools import lru_cache
 from pathlib import Path
+from pyarrow import ArrowException
+from config.defaults import PRAEDIGENE_DEFAULTS, PRAEDIALERT_DEFAULTS, VISN21_CSV_SCHEMAS
 
-def show_data_viewer(product_type, organization_type):
-    """Display loaded data in accessible tables"""
-    
-    st.markdown("""
+# Static page markup, built once at import
+_HEADER_HTML = """
     <div class="section-header">
         📊 Source Data Viewer
     </div>
-    """, unsafe_allow_html=True)
-    
-    st.markdown("""
+    """
+
+_INTRO_HTML = """
     <p style="font-size: 1.3rem; font-weight: 600; color: #000080; margin-bottom: 20px;">
         View the actual data being used in ROI calculations. This helps you understand the baseline metrics and make informed adjustments.
     </p>
-    """, unsafe_allow_html=True)
+    """
+
+_DESCRIPTION_TMPL = """
+    <p style="font-size: 1.2rem; font-weight: 600; color: #333; margin-bottom: 15px;">
+        {text}
+    </p>
+    """
+
+_BED_DAYS_INTRO_HTML = _DESCRIPTION_TMPL.format(
+    text="Annual patient bed days for each VISN21 facility. This data is used to calculate HAI rates and potential savings."
+)
+_HAI_INTRO_HTML = _DESCRIPTION_TMPL.format(
+    text="Rolling 12-month HAI rates by type and facility. These baseline rates determine potential infection prevention savings."
+)
+_DOT_INTRO_HTML = _DESCRIPTION_TMPL.format(
+    text="Quarterly antibiotic usage rates per 1000 patient days. This data drives antimicrobial stewardship savings calculations."
+)
+_DEFAULTS_INTRO_HTML = _DESCRIPTION_TMPL.format(
+    text="These are the default values being used for your calculations. You can adjust them using the sidebar controls."
+)
+
+_METRIC_TMPL = """
+    <div class="metric-card">
+        <div class="metric-value">{value}</div>
+        <div class="metric-label">{label}</div>
+    </div>
+    """
+
+# Stylesheet classes for each table layout variant; the roi-table rules
+# live in the accessibility stylesheet
+_TABLE_CLASSES = {
+    'wide': 'roi-table',
+    'wide_spaced': 'roi-table roi-table-spaced',
+    'compact': 'roi-table roi-table-compact',
+    'compact_spaced': 'roi-table roi-table-compact roi-table-spaced'
+}
+
+@st.cache_resource(show_spinner=False)
+def _data_files():
+    """Map each VISN21 data file stem to its path, scanning the directory once"""
+    base = Path(__file__).parent.parent / 'data'
+    return {path.stem: path for path in base.glob('visn21_*.csv')}
+
+def _sidecar_path(path, schema):
+    """Parquet sidecar for a CSV, named by a hash of the schema it was read with"""
+    # A schema change gives a new file name, so a sidecar written under the old
+    # column list is never read back
+    schema_hash = hashlib.blake2s(repr(schema).encode('utf-8'), digest_size=6).hexdigest()
+    return path.with_name(path.stem + '.' + schema_hash + '.parquet')
+
+def _write_sidecar(df, sidecar):
+    """Write a Parquet sidecar atomically; failures only cost the cache"""
+    # Written to a temp file in the same directory and renamed into place, so a
+    # crash or a concurrent writer never leaves a truncated sidecar behind
+    fd, tmp_name = tempfile.mkstemp(dir=sidecar.parent, prefix='.' + sidecar.stem + '.', suffix='.parquet')
+    os.close(fd)
+    
+    try:
+        df.to_parquet(tmp_name, compression='zstd', index=False)
+        os.replace(tmp_name, sidecar)
+    except (OSError, ValueError, ImportError, ArrowException):
+        # Read-only data directory or unwritable frame; keep serving from the CSV
+        try:
+            os.remove(tmp_name)
+        except OSError:
+            pass
+
+@st.cache_data(show_spinner=False, ttl=3600)
+def _load_csv(path_str):
+    """Read a data CSV once and serve it from cache on later reruns"""
+    path = Path(path_str)
+    schema = VISN21_CSV_SCHEMAS.get(path.name)
+    columns = list(schema) if schema else None
+    
+    # A Parquet sidecar at least as new as the CSV skips text parsing on cold starts
+    sidecar = _sidecar_path(path, schema)
+    if sidecar.is_file() and sidecar.stat().st_mtime >= path.stat().st_mtime:
+        try:
+            return pd.read_parquet(sidecar, columns=columns)
+        except (OSError, ValueError, ArrowException):
+            # Unreadable sidecar; parse the CSV and overwrite it below
+            pass
+    
+    # pyarrow's multithreaded parser; results keep numpy dtypes so the
+    # categorical/float32 schema and the display formatting behave as before
+    if schema is None:
+        df = pd.read_csv(path, engine='pyarrow')
+    else:
+        df = pd.read_csv(path, engine='pyarrow', usecols=columns, dtype=schema)
+    
+    _write_sidecar(df, sidecar)
+    
+    return df
+
+@st.cache_data(show_spinner=False)
+def _render_html_table(records, columns, css_variant, formats=()):
+    """Render table rows to class-styled HTML once per distinct table"""
+    # formats holds (column, format string) pairs applied while the HTML is written
+    return pd.DataFrame(list(records), columns=list(columns)).to_html(
+        index=False,
+        escape=False,
+        border=0,
+        classes=_TABLE_CLASSES[css_variant],
+        formatters={column: fmt.format for column, fmt in formats}
+    )
+
+@st.cache_data(show_spinner=False)
+def _dot_facility_tables(df):
+    """Render every facility's quarterly DOT table into a single HTML block"""
+    parts = []
+    
+    for facility, facility_df in df.groupby('facility', sort=False, observed=True)[['quarter', 'year', 'dot_per_1000_days']]:
+        quarters = facility_df['quarter'].astype(str) + ' ' + facility_df['year'].astype(str)
+        
+        parts.append(f'<p><strong>{facility}</strong></p>')
+        parts.append(_render_html_table(
+            tuple(zip(quarters, facility_df['dot_per_1000_days'])),
+            ('Quarter', 'DOT per 1000 Days'),
+            'compact',
+            (('DOT per 1000 Days', '{:.2f}'),)
+        ))
+    
+    return '\n'.join(parts)
+
+@st.cache_data(show_spinner=False)
+def _dot_summary(df):
+    """Compute the DOT summary statistics from a single facility groupby"""
+    dot = df['dot_per_1000_days']
+    means = dot.groupby(df['facility'], observed=True).mean()
+    overall_avg = dot.mean()
+    
+    return {
+        'overall_avg': overall_avg,
+        'highest_facility': means.idxmax(),
+        'highest_value': means.max(),
+        'lowest_facility': means.idxmin(),
+        'lowest_value': means.min(),
+        'variation': (dot.std() / overall_avg) * 100
+    }
+
+@st.cache_data(show_spinner=False)
+def _hai_summary(df):
+    """Aggregate HAI rates per type in one groupby"""
+    # Exclude VISN21 aggregate from the per-type statistics
+    facility_rates = df.loc[df['facility'] != 'VISN21', ['hai_type', 'rolling_12_months_rate']]
+    agg_df = facility_rates.groupby('hai_type', sort=False, observed=True)['rolling_12_months_rate'].agg(
+        average='mean',
+        maximum='max',
+        minimum='min',
+        nonzero=lambda rates: int((rates > 0).sum())
+    ).reset_index()
+    
+    return agg_df.rename(columns={
+        'hai_type': 'HAI Type',
+        'average': 'Average Rate',
+        'maximum': 'Max Rate',
+        'minimum': 'Min Rate',
+        'nonzero': 'Facilities with >0'
+    })
+
+@lru_cache(maxsize=32)
+def _param_tables(product_type, organization_type):
+    """Build the formatted default-parameter tables for a product and organization once"""
+    if product_type == 'praedigene':
+        defaults = PRAEDIGENE_DEFAULTS.get(organization_type, PRAEDIGENE_DEFAULTS['medium_hospital'])
+        pgx = defaults['pgx']
+        tso500 = defaults['tso500']
+        
+        return (
+            ("#### 💊 PGx Pipeline Defaults", (
+                ('Annual Volume', f"{pgx['annual_volume']:,}"),
+                ('ADR Cost', f"${pgx['adr_cost']:,}"),
+                ('Patient Impact', f"{pgx['patient_impact']}%"),
+                ('Readmission Rate', f"{pgx['readmission_rate']}%")
+            )),
+            ("#### 🧫 TSO500 Pipeline Defaults", (
+                ('Annual Volume', f"{tso500['annual_volume']:,}"),
+                ('Treatment Cost', f"${tso500['treatment_cost']:,}"),
+                ('Treatment Success', f"{tso500['treatment_success']}%"),
+                ('FTE Daily Cost', f"${tso500['fte_daily_cost']:,}")
+            ))
+        )
+    
+    # praedialert
+    defaults = PRAEDIALERT_DEFAULTS.get(organization_type, PRAEDIALERT_DEFAULTS['medium_hospital'])
+    ipc = defaults['ipc_surveillance']
+    anti = defaults['antimicrobial_stewardship']
+    
+    return (
+        ("#### 🦠 IPC Surveillance Defaults", (
+            ('Annual Patient Days', f"{ipc['annual_patient_days']:,}"),
+            ('HAI Incidence Rate', f"{ipc['hai_incidence_rate']}%"),
+            ('Cost per HAI', f"${ipc['cost_per_hai']:,}"),
+            ('Reduction Target', f"{ipc['reduction_target']}%")
+        )),
+        ("#### 💊 Antimicrobial Stewardship Defaults", (
+            ('Annual DOT', f"{anti['annual_dot']:,}"),
+            ('Cost per DOT', f"${anti['cost_per_dot']:,}"),
+            ('DOT Reduction Target', f"{anti['dot_reduction_target']}%"),
+            ('Antibiotic Cost Reduction', f"{anti['antibiotic_cost_reduction']}%")
+        ))
+    )
+
+def _show_html_table(df, css_variant='wide', formats=()):
+    """Display a DataFrame as a cached accessible HTML table"""
+    st.markdown(_render_html_table(
+        tuple(df.itertuples(index=False, name=None)),
+        tuple(df.columns),
+        css_variant,
+        formats
+    ), unsafe_allow_html=True)
+
+def _show_metric_cards(metrics):
+    """Render (value, label) pairs as a row of metric cards"""
+    for col, (value, label) in zip(st.columns(len(metrics)), metrics):
+        col.markdown(_METRIC_TMPL.format(value=value, label=label), unsafe_allow_html=True)
+
+def show_data_viewer(product_type, organization_type):
+    """Display loaded data in accessible tables"""
+    
+    st.markdown(_HEADER_HTML, unsafe_allow_html=True)
+    
+    st.markdown(_INTRO_HTML, unsafe_allow_html=True)
     
     # Check if VISN21 data is loaded
     if organization_type == 'visn21':
@@ -32,7 +258,7 @@ def show_data_viewer(product_type, organization_type):
 def show_visn21_data():
     """Display VISN21 data files in formatted tables"""
     
-    data_path = Path(__file__).parent.parent / 'data'
+    data_files = _data_files()
     
     # Create tabs for different data files
     tab1, tab2, tab3 = st.tabs([
@@ -42,233 +268,123 @@ def show_visn21_data():
     ])
     
     with tab1:
-        show_bed_days_data(data_path)
+        show_bed_days_data(data_files)
     
     with tab2:
-        show_hai_rates_data(data_path)
+        show_hai_rates_data(data_files)
     
     with tab3:
-        show_antibiotic_dot_data(data_path)
+        show_antibiotic_dot_data(data_files)
 
-def show_bed_days_data(data_path):
+def show_bed_days_data(data_files):
     """Display patient bed days data"""
     
     st.markdown("### 🏥 Patient Bed Days by Facility")
-    st.markdown("""
-    <p style="font-size: 1.2rem; font-weight: 600; color: #333; margin-bottom: 15px;">
-        Annual patient bed days for each VISN21 facility. This data is used to calculate HAI rates and potential savings.
-    </p>
-    """, unsafe_allow_html=True)
+    st.markdown(_BED_DAYS_INTRO_HTML, unsafe_allow_html=True)
+    
+    path = data_files.get('visn21_patient_bed_days')
+    if path is None or not path.is_file():
+        st.warning("Patient bed days data file not found")
+        return
     
     try:
-        df = pd.read_csv(data_path / 'visn21_patient_bed_days.csv')
+        df_calc = _load_csv(str(path))
         
-        # Format the numbers and rename columns to title case
-        df['bed_days_annual'] = df['bed_days_annual'].apply(lambda x: f"{x:,}")
-        df = df.rename(columns={
+        # Rename columns to title case; numbers are formatted as the table renders
+        df = df_calc.rename(columns={
             'facility': 'Facility',
             'facility_code': 'Facility Code', 
             'bed_days_annual': 'Annual Bed Days'
         })
         
-        # Create HTML table with accessibility styling
-        html_table = df.to_html(index=False, escape=False)
-        html_table = html_table.replace('<table', '<table style="background-color: white !important; width: 100%; border-collapse: collapse;"')
-        html_table = html_table.replace('<th', '<th style="background-color: #f5f5f5 !important; color: #000080 !important; padding: 20px !important; font-size: 1.8rem !important; font-weight: 900 !important; border: 2px solid #000080 !important; text-align: left;"')
-        html_table = html_table.replace('<td', '<td style="background-color: white !important; color: black !important; padding: 18px !important; font-size: 1.7rem !important; font-weight: 700 !important; border: 1px solid #ddd !important;"')
-        
-        st.markdown(html_table, unsafe_allow_html=True)
+        _show_html_table(df, 'wide', (('Annual Bed Days', '{:,}'),))
         
-        # Summary metrics
+        # Summary metrics (the VISN 21 roll-up row is excluded from per-facility figures)
         st.markdown("### 📈 Summary Statistics")
-        col1, col2, col3 = st.columns(3)
-        
-        # Reload for calculations
-        df_calc = pd.read_csv(data_path / 'visn21_patient_bed_days.csv')
+        facility_only = df_calc.loc[df_calc['facility'] != 'VISN 21', 'bed_days_annual']
         
-        with col1:
-            total_beds = df_calc['bed_days_annual'].sum()
-            st.markdown(f"""
-            <div class="metric-card">
-                <div class="metric-value">{total_beds:,}</div>
-                <div class="metric-label">Total Annual Bed Days</div>
-            </div>
-            """, unsafe_allow_html=True)
+        _show_metric_cards((
+            (f"{df_calc['bed_days_annual'].sum():,}", 'Total Annual Bed Days'),
+            (f"{facility_only.mean():,.0f}", 'Average per Facility'),
+            (f"{len(facility_only)}", 'Number of Facilities')
+        ))
         
-        with col2:
-            avg_beds = df_calc[df_calc['facility'] != 'VISN 21']['bed_days_annual'].mean()
-            st.markdown(f"""
-            <div class="metric-card">
-                <div class="metric-value">{avg_beds:,.0f}</div>
-                <div class="metric-label">Average per Facility</div>
-            </div>
-            """, unsafe_allow_html=True)
-        
-        with col3:
-            num_facilities = len(df_calc[df_calc['facility'] != 'VISN 21'])
-            st.markdown(f"""
-            <div class="metric-card">
-                <div class="metric-value">{num_facilities}</div>
-                <div class="metric-label">Number of Facilities</div>
-            </div>
-            """, unsafe_allow_html=True)
-            
-    except FileNotFoundError:
-        st.warning("Patient bed days data file not found")
     except Exception as e:
         st.error(f"Error loading bed days data: {str(e)}")
 
-def show_hai_rates_data(data_path):
+def show_hai_rates_data(data_files):
     """Display HAI rates data"""
     
     st.markdown("### 🦠 Healthcare-Associated Infection (HAI) Rates")
-    st.markdown("""
-    <p style="font-size: 1.2rem; font-weight: 600; color: #333; margin-bottom: 15px;">
-        Rolling 12-month HAI rates by type and facility. These baseline rates determine potential infection prevention savings.
-    </p>
-    """, unsafe_allow_html=True)
+    st.markdown(_HAI_INTRO_HTML, unsafe_allow_html=True)
+    
+    path = data_files.get('visn21_hai_rates')
+    if path is None or not path.is_file():
+        st.warning("HAI rates data file not found")
+        return
     
     try:
-        df = pd.read_csv(data_path / 'visn21_hai_rates.csv')
+        df = _load_csv(str(path))
         
-        # Group by HAI type for better visualization
-        hai_types = df['hai_type'].unique()
+        # Group by HAI type for better visualization (one pass, file order)
+        hai_groups = df.groupby('hai_type', sort=False, observed=True)
         
-        for hai_type in hai_types:
+        for hai_type, hai_group in hai_groups:
             st.markdown(f"#### {hai_type} Rates")
             
-            hai_df = df[df['hai_type'] == hai_type][['facility', 'rolling_12_months_rate', 'unit_of_measure']].copy()
-            hai_df['rolling_12_months_rate'] = hai_df['rolling_12_months_rate'].apply(lambda x: f"{x:.2f}")
-            
             # Rename columns to title case
-            hai_df = hai_df.rename(columns={
+            hai_df = hai_group[['facility', 'rolling_12_months_rate', 'unit_of_measure']].rename(columns={
                 'facility': 'Facility',
                 'rolling_12_months_rate': 'Rolling 12 Months Rate',
                 'unit_of_measure': 'Unit of Measure'
             })
             
-            # Create HTML table
-            html_table = hai_df.to_html(index=False, escape=False)
-            html_table = html_table.replace('<table', '<table style="background-color: white !important; width: 100%; border-collapse: collapse; margin-bottom: 30px;"')
-            html_table = html_table.replace('<th', '<th style="background-color: #f5f5f5 !important; color: #000080 !important; padding: 20px !important; font-size: 1.8rem !important; font-weight: 900 !important; border: 2px solid #000080 !important; text-align: left;"')
-            html_table = html_table.replace('<td', '<td style="background-color: white !important; color: black !important; padding: 18px !important; font-size: 1.7rem !important; font-weight: 700 !important; border: 1px solid #ddd !important;"')
-            
-            st.markdown(html_table, unsafe_allow_html=True)
+            _show_html_table(hai_df, 'wide_spaced', (('Rolling 12 Months Rate', '{:.2f}'),))
         
         # Summary by HAI type
         st.markdown("### 📊 HAI Type Summary")
-        summary_data = []
-        
-        for hai_type in hai_types:
-            hai_data = df[df['hai_type'] == hai_type]
-            # Exclude VISN21 aggregate from average calculation
-            facility_data = hai_data[hai_data['facility'] != 'VISN21']
-            
-            summary_data.append({
-                'HAI Type': hai_type,
-                'Average Rate': f"{facility_data['rolling_12_months_rate'].mean():.2f}",
-                'Max Rate': f"{facility_data['rolling_12_months_rate'].max():.2f}",
-                'Min Rate': f"{facility_data['rolling_12_months_rate'].min():.2f}",
-                'Facilities with >0': f"{(facility_data['rolling_12_months_rate'] > 0).sum()}"
-            })
+        summary_df = _hai_summary(df)
         
-        summary_df = pd.DataFrame(summary_data)
+        _show_html_table(summary_df, 'wide', (
+            ('Average Rate', '{:.2f}'),
+            ('Max Rate', '{:.2f}'),
+            ('Min Rate', '{:.2f}')
+        ))
         
-        # Create HTML table
-        html_table = summary_df.to_html(index=False, escape=False)
-        html_table = html_table.replace('<table', '<table style="background-color: white !important; width: 100%; border-collapse: collapse;"')
-        html_table = html_table.replace('<th', '<th style="background-color: #f5f5f5 !important; color: #000080 !important; padding: 20px !important; font-size: 1.8rem !important; font-weight: 900 !important; border: 2px solid #000080 !important; text-align: left;"')
-        html_table = html_table.replace('<td', '<td style="background-color: white !important; color: black !important; padding: 18px !important; font-size: 1.7rem !important; font-weight: 700 !important; border: 1px solid #ddd !important;"')
-        
-        st.markdown(html_table, unsafe_allow_html=True)
-        
-    except FileNotFoundError:
-        st.warning("HAI rates data file not found")
     except Exception as e:
         st.error(f"Error loading HAI rates data: {str(e)}")
 
-def show_antibiotic_dot_data(data_path):
+def show_antibiotic_dot_data(data_files):
     """Display antibiotic DOT data"""
     
     st.markdown("### 💊 Antibiotic Days of Therapy (DOT)")
-    st.markdown("""
-    <p style="font-size: 1.2rem; font-weight: 600; color: #333; margin-bottom: 15px;">
-        Quarterly antibiotic usage rates per 1000 patient days. This data drives antimicrobial stewardship savings calculations.
-    </p>
-    """, unsafe_allow_html=True)
+    st.markdown(_DOT_INTRO_HTML, unsafe_allow_html=True)
+    
+    path = data_files.get('visn21_antibiotic_dot')
+    if path is None or not path.is_file():
+        st.warning("Antibiotic DOT data file not found")
+        return
     
     try:
-        df = pd.read_csv(data_path / 'visn21_antibiotic_dot.csv')
-        
-        # Create quarterly trend view
-        quarters = df.groupby(['quarter', 'year']).agg({
-            'dot_per_1000_days': ['mean', 'min', 'max']
-        }).round(2)
+        df = _load_csv(str(path))
         
         # Facility-specific view
         st.markdown("#### Facility DOT by Quarter")
         
-        for facility in df['facility'].unique():
-            facility_df = df[df['facility'] == facility][['quarter', 'year', 'dot_per_1000_days']].copy()
-            facility_df['Quarter'] = facility_df['quarter'] + ' ' + facility_df['year'].astype(str)
-            facility_df['DOT per 1000 Days'] = facility_df['dot_per_1000_days'].apply(lambda x: f"{x:.2f}")
-            facility_df = facility_df[['Quarter', 'DOT per 1000 Days']]
-            
-            st.markdown(f"**{facility}**")
-            
-            # Create HTML table
-            html_table = facility_df.to_html(index=False, escape=False)
-            html_table = html_table.replace('<table', '<table style="background-color: white !important; width: 60%; border-collapse: collapse; margin-bottom: 20px;"')
-            html_table = html_table.replace('<th', '<th style="background-color: #f5f5f5 !important; color: #000080 !important; padding: 15px !important; font-size: 1.6rem !important; font-weight: 900 !important; border: 2px solid #000080 !important; text-align: left;"')
-            html_table = html_table.replace('<td', '<td style="background-color: white !important; color: black !important; padding: 12px !important; font-size: 1.5rem !important; font-weight: 700 !important; border: 1px solid #ddd !important;"')
-            
-            st.markdown(html_table, unsafe_allow_html=True)
+        st.markdown(_dot_facility_tables(df), unsafe_allow_html=True)
         
         # Overall summary
         st.markdown("### 📈 DOT Summary Statistics")
         
-        col1, col2, col3, col4 = st.columns(4)
+        summary = _dot_summary(df)
         
-        with col1:
-            overall_avg = df['dot_per_1000_days'].mean()
-            st.markdown(f"""
-            <div class="metric-card">
-                <div class="metric-value">{overall_avg:.1f}</div>
-                <div class="metric-label">Average DOT/1000 Days</div>
-            </div>
-            """, unsafe_allow_html=True)
+        _show_metric_cards((
+            (f"{summary['overall_avg']:.1f}", 'Average DOT/1000 Days'),
+            (f"{summary['highest_value']:.1f}", f"Highest Avg ({summary['highest_facility']})"),
+            (f"{summary['lowest_value']:.1f}", f"Lowest Avg ({summary['lowest_facility']})"),
+            (f"{summary['variation']:.1f}%", 'Coefficient of Variation')
+        ))
         
-        with col2:
-            highest_facility = df.groupby('facility')['dot_per_1000_days'].mean().idxmax()
-            highest_value = df.groupby('facility')['dot_per_1000_days'].mean().max()
-            st.markdown(f"""
-            <div class="metric-card">
-                <div class="metric-value">{highest_value:.1f}</div>
-                <div class="metric-label">Highest Avg ({highest_facility})</div>
-            </div>
-            """, unsafe_allow_html=True)
-        
-        with col3:
-            lowest_facility = df.groupby('facility')['dot_per_1000_days'].mean().idxmin()
-            lowest_value = df.groupby('facility')['dot_per_1000_days'].mean().min()
-            st.markdown(f"""
-            <div class="metric-card">
-                <div class="metric-value">{lowest_value:.1f}</div>
-                <div class="metric-label">Lowest Avg ({lowest_facility})</div>
-            </div>
-            """, unsafe_allow_html=True)
-        
-        with col4:
-            variation = (df['dot_per_1000_days'].std() / df['dot_per_1000_days'].mean()) * 100
-            st.markdown(f"""
-            <div class="metric-card">
-                <div class="metric-value">{variation:.1f}%</div>
-                <div class="metric-label">Coefficient of Variation</div>
-            </div>
-            """, unsafe_allow_html=True)
-        
-    except FileNotFoundError:
-        st.warning("Antibiotic DOT data file not found")
     except Exception as e:
         st.error(f"Error loading antibiotic DOT data: {str(e)}")
 
@@ -276,68 +392,17 @@ def show_default_parameters(product_type, organization_type):
     """Show default parameters being used when no CSV data is loaded"""
     
     st.markdown("### 📋 Default Parameters in Use")
-    st.markdown("""
-    <p style="font-size: 1.2rem; font-weight: 600; color: #333; margin-bottom: 15px;">
-        These are the default values being used for your calculations. You can adjust them using the sidebar controls.
-    </p>
-    """, unsafe_allow_html=True)
-    
-    from config.defaults import PRAEDIGENE_DEFAULTS, PRAEDIALERT_DEFAULTS
+    st.markdown(_DEFAULTS_INTRO_HTML, unsafe_allow_html=True)
     
-    if product_type == 'praedigene':
-        defaults = PRAEDIGENE_DEFAULTS.get(organization_type, PRAEDIGENE_DEFAULTS['medium_hospital'])
-        
-        # Show PGx defaults
-        st.markdown("#### 💊 PGx Pipeline Defaults")
-        pgx_data = [
-            ['Annual Volume', f"{defaults['pgx']['annual_volume']:,}"],
-            ['ADR Cost', f"${defaults['pgx']['adr_cost']:,}"],
-            ['Patient Impact', f"{defaults['pgx']['patient_impact']}%"],
-            ['Readmission Rate', f"{defaults['pgx']['readmission_rate']}%"]
-        ]
-        show_parameter_table(pgx_data)
-        
-        # Show TSO500 defaults
-        st.markdown("#### 🧫 TSO500 Pipeline Defaults")
-        tso500_data = [
-            ['Annual Volume', f"{defaults['tso500']['annual_volume']:,}"],
-            ['Treatment Cost', f"${defaults['tso500']['treatment_cost']:,}"],
-            ['Treatment Success', f"{defaults['tso500']['treatment_success']}%"],
-            ['FTE Daily Cost', f"${defaults['tso500']['fte_daily_cost']:,}"]
-        ]
-        show_parameter_table(tso500_data)
-        
-    else:  # praedialert
-        defaults = PRAEDIALERT_DEFAULTS.get(organization_type, PRAEDIALERT_DEFAULTS['medium_hospital'])
-        
-        # Show IPC defaults
-        st.markdown("#### 🦠 IPC Surveillance Defaults")
-        ipc_data = [
-            ['Annual Patient Days', f"{defaults['ipc_surveillance']['annual_patient_days']:,}"],
-            ['HAI Incidence Rate', f"{defaults['ipc_surveillance']['hai_incidence_rate']}%"],
-            ['Cost per HAI', f"${defaults['ipc_surveillance']['cost_per_hai']:,}"],
-            ['Reduction Target', f"{defaults['ipc_surveillance']['reduction_target']}%"]
-        ]
-        show_parameter_table(ipc_data)
-        
-        # Show Antimicrobial defaults
-        st.markdown("#### 💊 Antimicrobial Stewardship Defaults")
-        anti_data = [
-            ['Annual DOT', f"{defaults['antimicrobial_stewardship']['annual_dot']:,}"],
-            ['Cost per DOT', f"${defaults['antimicrobial_stewardship']['cost_per_dot']:,}"],
-            ['DOT Reduction Target', f"{defaults['antimicrobial_stewardship']['dot_reduction_target']}%"],
-            ['Antibiotic Cost Reduction', f"{defaults['antimicrobial_stewardship']['antibiotic_cost_reduction']}%"]
-        ]
-        show_parameter_table(anti_data)
+    for heading, rows in _param_tables(product_type, organization_type):
+        st.markdown(heading)
+        show_parameter_table(rows)
 
 def show_parameter_table(data):
     """Display a parameter table with consistent formatting"""
     
-    df = pd.DataFrame(data, columns=['Parameter', 'Value'])
-    
-    html_table = df.to_html(index=False, escape=False)
-    html_table = html_table.replace('<table', '<table style="background-color: white !important; width: 60%; border-collapse: collapse; margin-bottom: 30px;"')
-    html_table = html_table.replace('<th', '<th style="background-color: #f5f5f5 !important; color: #000080 !important; padding: 15px !important; font-size: 1.6rem !important; font-weight: 900 !important; border: 2px solid #000080 !important; text-align: left;"')
-    html_table = html_table.replace('<td', '<td style="background-color: white !important; color: black !important; padding: 12px !important; font-size: 1.5rem !important; font-weight: 700 !important; border: 1px solid #ddd !important;"')
-    
-    st.markdown(html_table, unsafe_allow_html=True)
\ No newline at end of file
+    st.markdown(_render_html_table(
+        tuple(map(tuple, data)),
+        ('Parameter', 'Value'),
+        'compact_spaced'
+    ), unsafe_allow_html=True)
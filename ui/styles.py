@@ -4,48 +4,44 @@ UI Styles for ROI Calculator
 
 import streamlit as st
 from config.defaults import BITSCOPIC_COLORS
+from ui.enhanced_accessibility_styles import minify_css
 
-def load_css():
-    """Load custom CSS styles with high contrast for accessibility"""
-    st.markdown(f"""
+# Rules are split into a critical block (page chrome, header, metric cards,
+# section headers, buttons) and a deferred block for widgets further down
+# the page, emitted after it so the original cascade order is kept
+_CRITICAL_CSS_TEMPLATE = """
     <style>
-        /* Main App Styling - High Contrast */
-        .stApp {{
-            background-color: {BITSCOPIC_COLORS['background']};
-            color: {BITSCOPIC_COLORS['text']};
-        }}
-        
-        /* Ensure all text is readable */
+        /* Ensure all text is readable (app background and text colour come
+           from the theme in .streamlit/config.toml) */
         p, span, div, label {{
-            color: {BITSCOPIC_COLORS['text']} !important;
             font-size: 1.05em;
             line-height: 1.6;
         }}
         
         /* Header Styling - Solid colors for better contrast */
         .main-header {{
-            background: {BITSCOPIC_COLORS['primary']};
+            background: {primary};
             color: white;
             padding: 35px;
             border-radius: 10px;
             margin-bottom: 30px;
             text-align: center;
             box-shadow: 0 4px 8px rgba(0,0,0,0.2);
-            border: 3px solid {BITSCOPIC_COLORS['primary']};
+            border: 3px solid {primary};
         }}
         
         .header-title {{
             font-size: 2.8em;
             font-weight: 900;
             margin-bottom: 10px;
-            color: white !important;
+            color: white;
             text-shadow: 2px 2px 4px rgba(0,0,0,0.3);
         }}
         
         .header-subtitle {{
             font-size: 1.4em;
             font-weight: 600;
-            color: white !important;
+            color: white;
         }}
         
         /* Metric Cards - High Contrast */
@@ -55,29 +51,30 @@ def load_css():
             padding: 28px;
             text-align: center;
             box-shadow: 0 3px 6px rgba(0,0,0,0.15);
-            border: 2px solid {BITSCOPIC_COLORS['primary']};
-            border-left: 6px solid {BITSCOPIC_COLORS['orange']};
-            transition: all 0.3s ease;
+            border: 2px solid {primary};
+            border-left: 6px solid {orange};
+            transition: transform 0.3s ease, box-shadow 0.3s ease, border-color 0.3s ease;
             height: 100%;
         }}
         
         .metric-card:hover {{
+            will-change: transform;
             transform: translateY(-3px);
             box-shadow: 0 6px 12px rgba(0,0,0,0.25);
-            border-color: {BITSCOPIC_COLORS['orange']};
+            border-color: {orange};
         }}
         
         .metric-value {{
             font-size: 1.8em;
             font-weight: 700;
-            color: {BITSCOPIC_COLORS['primary']};
+            color: {primary};
             margin-bottom: 8px;
             line-height: 1.2;
         }}
         
         .metric-label {{
             font-size: 1.1em;
-            color: {BITSCOPIC_COLORS['dark_text']};
+            color: {dark_text};
             text-transform: uppercase;
             letter-spacing: 0.5px;
             font-weight: 700;
@@ -92,30 +89,59 @@ def load_css():
         }}
         
         .metric-positive {{
-            color: {BITSCOPIC_COLORS['accent']};
+            color: {accent};
             background: rgba(0, 195, 137, 0.1);
         }}
         
         .metric-negative {{
-            color: {BITSCOPIC_COLORS['danger']};
+            color: {danger};
             background: rgba(220, 53, 69, 0.1);
         }}
         
         /* Section Headers */
         .section-header {{
-            color: {BITSCOPIC_COLORS['primary']};
+            color: {primary};
             font-size: 1.8em;
             font-weight: 600;
             margin: 40px 0 25px 0;
             padding-bottom: 10px;
-            border-bottom: 3px solid {BITSCOPIC_COLORS['orange']};
+            border-bottom: 3px solid {orange};
+        }}
+        
+        /* Buttons - High Contrast */
+        .stButton > button {{
+            background: {primary};
+            color: white !important;
+            border: 2px solid {primary};
+            border-radius: 6px;
+            padding: 12px 28px;
+            font-weight: 700;
+            font-size: 1.1em;
+            transition: background-color 0.3s ease, border-color 0.3s ease, transform 0.3s ease, box-shadow 0.3s ease;
+            box-shadow: 0 3px 6px rgba(0,0,0,0.2);
         }}
         
+        .stButton > button:hover {{
+            background: {orange};
+            border-color: {orange};
+            transform: translateY(-2px);
+            box-shadow: 0 5px 10px rgba(0,0,0,0.3);
+        }}
+        
+        .stButton > button:focus {{
+            outline: 3px solid {warning};
+            outline-offset: 2px;
+        }}
+    </style>
+"""
+
+_DEFERRED_CSS_TEMPLATE = """
+    <style>
         /* Info Boxes - High Contrast */
         .info-box {{
             background: white;
-            border: 2px solid {BITSCOPIC_COLORS['secondary']};
-            border-left: 6px solid {BITSCOPIC_COLORS['secondary']};
+            border: 2px solid {secondary};
+            border-left: 6px solid {secondary};
             border-radius: 8px;
             padding: 24px;
             margin: 20px 0;
@@ -124,13 +150,13 @@ def load_css():
         
         .info-box-title {{
             font-weight: 800;
-            color: {BITSCOPIC_COLORS['primary']};
+            color: {primary};
             margin-bottom: 12px;
             font-size: 1.3em;
         }}
         
         .info-box-content {{
-            color: {BITSCOPIC_COLORS['text']};
+            color: {text};
             line-height: 1.8;
             font-size: 1.1em;
             font-weight: 500;
@@ -148,7 +174,7 @@ def load_css():
         .chart-title {{
             font-size: 1.4em;
             font-weight: 600;
-            color: {BITSCOPIC_COLORS['primary']};
+            color: {primary};
             margin-bottom: 20px;
             text-align: center;
         }}
@@ -163,40 +189,15 @@ def load_css():
         
         .stTabs [data-baseweb="tab"] {{
             border-radius: 8px;
-            color: {BITSCOPIC_COLORS['neutral']};
+            color: {neutral};
             font-weight: 500;
         }}
         
         .stTabs [aria-selected="true"] {{
-            background-color: {BITSCOPIC_COLORS['orange']};
+            background-color: {orange};
             color: white;
         }}
         
-        /* Buttons - High Contrast */
-        .stButton > button {{
-            background: {BITSCOPIC_COLORS['primary']};
-            color: white !important;
-            border: 2px solid {BITSCOPIC_COLORS['primary']};
-            border-radius: 6px;
-            padding: 12px 28px;
-            font-weight: 700;
-            font-size: 1.1em;
-            transition: all 0.3s ease;
-            box-shadow: 0 3px 6px rgba(0,0,0,0.2);
-        }}
-        
-        .stButton > button:hover {{
-            background: {BITSCOPIC_COLORS['orange']};
-            border-color: {BITSCOPIC_COLORS['orange']};
-            transform: translateY(-2px);
-            box-shadow: 0 5px 10px rgba(0,0,0,0.3);
-        }}
-        
-        .stButton > button:focus {{
-            outline: 3px solid {BITSCOPIC_COLORS['warning']};
-            outline-offset: 2px;
-        }}
-        
         /* Sidebar Styling - Better Contrast */
         .css-1d391kg {{
             background-color: #f0f0f0;
@@ -204,40 +205,39 @@ def load_css():
         
         /* Sidebar text */
         .css-1d391kg p, .css-1d391kg label, .css-1d391kg span {{
-            color: {BITSCOPIC_COLORS['text']} !important;
-            font-size: 1.1em !important;
+            font-size: 1.1em;
             font-weight: 500;
         }}
         
         /* Input fields - Better visibility */
-        .stTextInput > div > div > input,
-        .stNumberInput > div > div > input,
-        .stSelectbox > div > div > select {{
+        .stTextInput input,
+        .stNumberInput input,
+        .stSelectbox select {{
             font-size: 1.15em !important;
             padding: 10px !important;
-            border: 2px solid {BITSCOPIC_COLORS['primary']} !important;
+            border: 2px solid {primary} !important;
             background-color: white !important;
-            color: {BITSCOPIC_COLORS['text']} !important;
+            color: {text} !important;
             font-weight: 500;
         }}
         
-        .stTextInput > div > div > input:focus,
-        .stNumberInput > div > div > input:focus,
-        .stSelectbox > div > div > select:focus {{
-            border-color: {BITSCOPIC_COLORS['orange']} !important;
+        .stTextInput input:focus,
+        .stNumberInput input:focus,
+        .stSelectbox select:focus {{
+            border-color: {orange} !important;
             outline: 3px solid rgba(211, 84, 0, 0.2) !important;
             outline-offset: 2px;
         }}
         
         /* Sliders - Better visibility */
         .stSlider > div > div > div > div {{
-            background-color: {BITSCOPIC_COLORS['primary']} !important;
+            background-color: {primary} !important;
         }}
         
         .stSlider label {{
             font-size: 1.1em !important;
             font-weight: 600 !important;
-            color: {BITSCOPIC_COLORS['text']} !important;
+            color: {text} !important;
         }}
         
         /* Parameter Groups */
@@ -251,7 +251,7 @@ def load_css():
         
         .param-group-title {{
             font-weight: 600;
-            color: {BITSCOPIC_COLORS['primary']};
+            color: {primary};
             margin-bottom: 15px;
             font-size: 1.1em;
             display: flex;
@@ -260,15 +260,15 @@ def load_css():
         }}
         
         .param-impact-high {{
-            border-left: 4px solid {BITSCOPIC_COLORS['danger']};
+            border-left: 4px solid {danger};
         }}
         
         .param-impact-medium {{
-            border-left: 4px solid {BITSCOPIC_COLORS['warning']};
+            border-left: 4px solid {warning};
         }}
         
         .param-impact-low {{
-            border-left: 4px solid {BITSCOPIC_COLORS['accent']};
+            border-left: 4px solid {accent};
         }}
         
         /* Summary Cards Grid */
@@ -300,7 +300,7 @@ def load_css():
         }}
         
         .comparison-table th {{
-            background: {BITSCOPIC_COLORS['primary']};
+            background: {primary};
             color: white;
             padding: 12px;
             text-align: left;
@@ -316,12 +316,22 @@ def load_css():
             background-color: #f8f9fa;
         }}
         
+        /* Below-the-fold containers skip layout and paint until scrolled
+           into view; the intrinsic size keeps the scrollbar stable */
+        .comparison-table,
+        .chart-container,
+        .param-group {{
+            content-visibility: auto;
+            contain-intrinsic-size: auto 400px;
+        }}
+        
         /* Alert Boxes - High Contrast */
-        .alert-success {{
+        .alert-success,
+        .alert-info,
+        .alert-warning {{
             background: white;
-            border: 2px solid {BITSCOPIC_COLORS['accent']};
-            border-left: 6px solid {BITSCOPIC_COLORS['accent']};
-            color: #003d00;
+            border: 2px solid;
+            border-left-width: 6px;
             padding: 18px 24px;
             border-radius: 8px;
             margin: 15px 0;
@@ -329,28 +339,19 @@ def load_css():
             font-size: 1.1em;
         }}
         
+        .alert-success {{
+            border-color: {accent};
+            color: #003d00;
+        }}
+        
         .alert-info {{
-            background: white;
-            border: 2px solid {BITSCOPIC_COLORS['secondary']};
-            border-left: 6px solid {BITSCOPIC_COLORS['secondary']};
+            border-color: {secondary};
             color: #002040;
-            padding: 18px 24px;
-            border-radius: 8px;
-            margin: 15px 0;
-            font-weight: 600;
-            font-size: 1.1em;
         }}
         
         .alert-warning {{
-            background: white;
-            border: 2px solid {BITSCOPIC_COLORS['warning']};
-            border-left: 6px solid {BITSCOPIC_COLORS['warning']};
+            border-color: {warning};
             color: #4d2800;
-            padding: 18px 24px;
-            border-radius: 8px;
-            margin: 15px 0;
-            font-weight: 600;
-            font-size: 1.1em;
         }}
         
         /* Loading Animation */
@@ -358,7 +359,7 @@ def load_css():
             width: 50px;
             height: 50px;
             border: 4px solid #f3f3f3;
-            border-top: 4px solid {BITSCOPIC_COLORS['orange']};
+            border-top: 4px solid {orange};
             border-radius: 50%;
             animation: spin 1s linear infinite;
             margin: 20px auto;
@@ -372,8 +373,8 @@ def load_css():
         /* Streamlit Built-in Metrics Override - More Specific Selectors */
         div[data-testid="metric-container"] {{
             background: white !important;
-            border: 2px solid {BITSCOPIC_COLORS['primary']} !important;
-            border-left: 6px solid {BITSCOPIC_COLORS['orange']} !important;
+            border: 2px solid {primary} !important;
+            border-left: 6px solid {orange} !important;
             padding: 16px !important;
             border-radius: 8px !important;
             box-shadow: 0 2px 4px rgba(0,0,0,0.1) !important;
@@ -387,7 +388,7 @@ def load_css():
         div[data-testid="metric-container"] div[data-testid="stMetricValue"] {{
             font-size: 1.2em !important;
             font-weight: 700 !important;
-            color: {BITSCOPIC_COLORS['primary']} !important;
+            color: {primary} !important;
             text-align: center !important;
             line-height: 1.2 !important;
         }}
@@ -395,12 +396,12 @@ def load_css():
         div[data-testid="metric-container"] div[data-testid="stMetricValue"] > div {{
             font-size: 1.2em !important;
             font-weight: 700 !important;
-            color: {BITSCOPIC_COLORS['primary']} !important;
+            color: {primary} !important;
         }}
         
         div[data-testid="metric-container"] div[data-testid="stMetricLabel"] {{
             font-size: 0.85em !important;
-            color: {BITSCOPIC_COLORS['dark_text']} !important;
+            color: {dark_text} !important;
             font-weight: 600 !important;
             text-align: center !important;
             text-transform: uppercase !important;
@@ -424,32 +425,58 @@ def load_css():
         .stMetric [data-testid="stMetricValue"] {{
             font-size: 1.2em !important;
         }}
-        
-        /* Responsive Design */
-        @media (max-width: 768px) {{
-            .summary-grid {{
-                grid-template-columns: 1fr;
-            }}
-            
-            .header-title {{
-                font-size: 2em;
-            }}
-            
-            .metric-value {{
-                font-size: 1.5em;
-            }}
-            
-            div[data-testid="metric-container"] div[data-testid="stMetricValue"] {{
-                font-size: 1.0em !important;
-            }}
-            
-            div[data-testid="metric-container"] div[data-testid="stMetricValue"] > div {{
-                font-size: 1.0em !important;
-            }}
-            
-            .stMetric [data-testid="stMetricValue"] {{
-                font-size: 1.0em !important;
-            }}
-        }}
     </style>
-    """, unsafe_allow_html=True)
\ No newline at end of file
+"""
+
+# Narrow-screen overrides live in their own style element with a media
+# attribute instead of an @media block, so wide screens never apply them
+_MOBILE_CSS = """
+    <style media="(max-width: 768px)">
+        .summary-grid {
+            grid-template-columns: 1fr;
+        }
+        
+        .header-title {
+            font-size: 2em;
+        }
+        
+        .metric-value {
+            font-size: 1.5em;
+        }
+        
+        div[data-testid="metric-container"] div[data-testid="stMetricValue"] {
+            font-size: 1.0em !important;
+        }
+        
+        div[data-testid="metric-container"] div[data-testid="stMetricValue"] > div {
+            font-size: 1.0em !important;
+        }
+        
+        .stMetric [data-testid="stMetricValue"] {
+            font-size: 1.0em !important;
+        }
+    </style>
+"""
+
+# Both templates use named placeholders for the palette and are formatted
+# and minified once at import
+_CRITICAL_CSS_HTML = minify_css(_CRITICAL_CSS_TEMPLATE.format(**BITSCOPIC_COLORS))
+_DEFERRED_CSS_HTML = minify_css(_DEFERRED_CSS_TEMPLATE.format(**BITSCOPIC_COLORS)) + minify_css(_MOBILE_CSS)
+
+@st.cache_resource
+def _css_payloads():
+    """Return the critical and deferred style blocks shared by every session"""
+    return _CRITICAL_CSS_HTML, _DEFERRED_CSS_HTML
+
+def load_critical_css():
+    """Load the styles for above-the-fold elements"""
+    st.markdown(_css_payloads()[0], unsafe_allow_html=True)
+
+def load_deferred_css():
+    """Load the styles for tabs, tables, inputs, alerts and responsive tweaks"""
+    st.markdown(_css_payloads()[1], unsafe_allow_html=True)
+
+def load_css():
+    """Load custom CSS styles with high contrast for accessibility"""
+    load_critical_css()
+    load_deferred_css()
@@ -3,16 +3,178 @@ Stage 2: Calculation Documentation Module
 Provides detailed calculation methodologies, formulas, and worked examples
 """
 
-import pandas as pd
-import numpy as np
-from datetime import datetime
+import json
+from collections import namedtuple
+from functools import wraps
+from itertools import accumulate
+
+# Cost of one HAI and the HAIs prevented per year; the worked-example strings
+# below are derived from them once at import so the figures stay consistent
+_COST_PER_HAI = 45000
+_HAIS_PREVENTED_ANNUAL = 200
+_OTHER_ANNUAL_SAVINGS = 2000000
+_BENEFITS_EXAMPLE = (
+    f'{_HAIS_PREVENTED_ANNUAL} × ${_COST_PER_HAI:,} + ${_OTHER_ANNUAL_SAVINGS:,} = '
+    f'${_HAIS_PREVENTED_ANNUAL * _COST_PER_HAI + _OTHER_ANNUAL_SAVINGS:,}'
+)
+_SHREVEPORT_CALC = f'25 cases × ${_COST_PER_HAI:,} = ${25 * _COST_PER_HAI:,}'
+_NEW_ORLEANS_CALC = f'40 cases × ${_COST_PER_HAI:,} = ${40 * _COST_PER_HAI:,}'
+_SAVINGS_FORMULA = f'HAIs Prevented × ${_COST_PER_HAI:,}'
+
+# Sensitivity range endpoints; the savings at each endpoint are derived from
+# these and the base-case constants above
+_HAIS_PREVENTED_PESSIMISTIC = 138  # 30% of 460 baseline
+_HAIS_PREVENTED_OPTIMISTIC = 230
+_COST_PER_HAI_PESSIMISTIC = 35000
+_COST_PER_HAI_OPTIMISTIC = 55000
+
+# Literal tables are kept as plain dict-of-lists payloads built once at
+# import; to_dataframe() materializes one for callers that need pandas
+_HAI_VERIFICATION_TABLE = {
+    'Facility': ['Palo Alto', 'West Palm Beach', 'Las Vegas', 'Greater LA',
+                 'Loma Linda', 'Shreveport', 'Dallas', 'Total (excl. NO)'],
+    'Pre_HAIs': [74, 43, 41, 111, 88, 247, 237, 688],
+    'Post_HAIs': [60, 15, 26, 56, 47, 106, 86, 388],
+    'Reduction': [14, 28, 15, 55, 41, 141, 151, 300],
+    'Percent': [18.9, 65.1, 36.6, 49.5, 46.6, 57.0, 63.5, 43.6]
+}
+
+_YOY_TABLE = {
+    'Year': [1, 2, 3, 4, 5],
+    'Costs': [235000, 70000, 70000, 70000, 70000],
+    'Benefits': [11000000, 11550000, 12127500, 12734000, 13370000],
+    'Net': [10765000, 11480000, 12057500, 12664000, 13300000],
+    'Cumulative_Net': [10765000, 22245000, 34302500, 46966500, 60266500],
+    'ROI_Percent': [4580, 16400, 17225, 18091, 19000]
+}
+
+def _cashflow_table(months):
+    """Monthly investment, savings and running net cashflow over a horizon"""
+    investment = [170833] + [5833] * (months - 1)
+    savings = [1166667] * months
+    net = [saved - spent for saved, spent in zip(savings, investment)]
+    return {
+        'Month': list(range(1, months + 1)),
+        'Investment': investment,
+        'Savings': savings,
+        'Net_Cashflow': net,
+        'Cumulative': list(accumulate(net))
+    }
+
+_CASHFLOW_TABLE = _cashflow_table(12)
+
+_TORNADO_TABLE = {
+    'Variable': ['HAI Reduction Rate', 'Cost per HAI', 'Implementation Cost',
+                 'Annual Operating', 'LOS Days Saved'],
+    'Low_Impact': [2541, 2879, 3500, 3650, 3400],
+    'High_Impact': [4304, 4580, 3960, 3810, 4060],
+    'Swing': [1763, 1701, 460, 160, 660]
+}
+
+# Group change formula shared by the intervention and control steps of the
+# difference-in-differences walkthrough
+_PCT_CHANGE_FORMULA = '(Post - Pre) / Pre × 100'
+
+# Summary table rows as (Calculation, Formula, Value, Source)
+_SUMMARY_COLUMNS = ('Calculation', 'Formula', 'Value', 'Source')
+_SUMMARY_ROWS = (
+    ('HAI Reduction Rate', '(Pre - Post) / Pre × 100', '43.6%', '8-facility study'),
+    ('HAIs Prevented (Annual)', 'Baseline × Reduction Rate', str(_HAIS_PREVENTED_ANNUAL), 'Calculated'),
+    ('Cost per HAI', 'Direct + Indirect Costs', f'${_COST_PER_HAI:,}', 'CDC + VA data'),
+    ('Total Annual Savings', 'HAIs × Cost + Other Benefits', '$11,000,000', 'Calculated'),
+    ('Implementation Cost', 'Software + Setup + Training', '$165,000', 'Vendor quote'),
+    ('Annual Operating Cost', 'Maintenance + Support + Staff', '$70,000', 'Vendor quote'),
+    ('First Year ROI', '((Benefits - Costs) / Costs) × 100', '4,580%', 'Calculated'),
+    ('Payback Period', 'Investment / Monthly Savings', '1.76 months', 'Calculated'),
+    ('Control Group Improvement', 'Intervention - Control Change', '16.0 pp', 'DiD analysis'),
+    ('Relative Effectiveness', 'DiD / Control × 100', '58%', 'Calculated'),
+    ('5-Year Net Benefit', 'Σ(Annual Benefits - Costs) × 5', '$60,266,500', 'Projection'),
+    ('Lives Saved Annually', 'HAIs Prevented × 5% Mortality', '10', 'CDC mortality data')
+)
+
+# One record per step of a documented calculation; adjustment is only set
+# on steps that exclude part of the study data
+CalculationStep = namedtuple(
+    'CalculationStep',
+    ['step', 'name', 'formula', 'example', 'notes', 'adjustment'],
+    defaults=[None]
+)
+
+_HAI_STEPS = (
+    CalculationStep(
+        1,
+        'Baseline HAI Count',
+        'Baseline HAIs = Σ(Pre-implementation HAIs for all facilities)',
+        '74 + 43 + 41 + 111 + 33 + 88 + 247 + 237 = 688 HAIs',
+        'Sum of all HAIs in 18-month pre-implementation period'
+    ),
+    CalculationStep(
+        2,
+        'Post-Implementation HAI Count',
+        'Post HAIs = Σ(Post-implementation HAIs for all facilities)',
+        '60 + 15 + 26 + 56 + 47 + 106 + 86 = 396 HAIs',
+        'Excluding New Orleans outbreak (special case)',
+        'New Orleans excluded due to detected community MRSA surge'
+    ),
+    CalculationStep(
+        3,
+        'Absolute Reduction',
+        'Reduction = Baseline HAIs - Post HAIs',
+        '688 - 388 = 300 HAIs prevented',
+        'Total infections prevented across all facilities'
+    ),
+    CalculationStep(
+        4,
+        'Percentage Reduction',
+        'Reduction % = (Reduction / Baseline) × 100',
+        '(300 / 688) × 100 = 43.6%',
+        'Overall effectiveness rate'
+    ),
+    CalculationStep(
+        5,
+        'Annualization',
+        'Annual Rate = (18-month value) × (12/18)',
+        '300 HAIs × (12/18) = 200 HAIs prevented annually',
+        'Converts 18-month study period to annual rate'
+    )
+)
+
+def to_dataframe(table):
+    """Return a dict-of-lists documentation table as a DataFrame"""
+    import pandas as pd
+    return pd.DataFrame(table)
+
+def _jsonable(value):
+    """Convert nested namedtuples to dicts so JSON keeps their field names"""
+    if hasattr(value, '_asdict'):
+        return _jsonable(value._asdict())
+    if isinstance(value, dict):
+        return {key: _jsonable(item) for key, item in value.items()}
+    if isinstance(value, (list, tuple)):
+        return [_jsonable(item) for item in value]
+    return value
+
+def _memoized(method):
+    """Cache a getter's payload on the instance after the first call"""
+    @wraps(method)
+    def wrapper(self):
+        if method.__name__ not in self._cache:
+            self._cache[method.__name__] = method(self)
+        return self._cache[method.__name__]
+    return wrapper
 
 class CalculationDocumentation:
     """Comprehensive documentation of all ROI calculations"""
     
+    __slots__ = ('roi_results', '_cache')
+    
     def __init__(self, roi_results=None):
         self.roi_results = roi_results or {}
+        # Payloads are built from literals only, so each getter runs once per
+        # instance; callers share the returned dicts and tables read-only
+        self._cache = {}
         
+    @_memoized
     def get_hai_reduction_calculations(self):
         """Detailed HAI reduction calculation methodology"""
         return {
@@ -21,54 +183,11 @@ class CalculationDocumentation:
                 'description': 'How we calculate the 43.6% reduction rate from study data',
                 'source': '8 VA Medical Centers, 18-month pre/post analysis'
             },
-            'step_by_step': [
-                {
-                    'step': 1,
-                    'name': 'Baseline HAI Count',
-                    'formula': 'Baseline HAIs = Σ(Pre-implementation HAIs for all facilities)',
-                    'example': '74 + 43 + 41 + 111 + 33 + 88 + 247 + 237 = 688 HAIs',
-                    'notes': 'Sum of all HAIs in 18-month pre-implementation period'
-                },
-                {
-                    'step': 2,
-                    'name': 'Post-Implementation HAI Count',
-                    'formula': 'Post HAIs = Σ(Post-implementation HAIs for all facilities)',
-                    'example': '60 + 15 + 26 + 56 + 47 + 106 + 86 = 396 HAIs',
-                    'notes': 'Excluding New Orleans outbreak (special case)',
-                    'adjustment': 'New Orleans excluded due to detected community MRSA surge'
-                },
-                {
-                    'step': 3,
-                    'name': 'Absolute Reduction',
-                    'formula': 'Reduction = Baseline HAIs - Post HAIs',
-                    'example': '688 - 388 = 300 HAIs prevented',
-                    'notes': 'Total infections prevented across all facilities'
-                },
-                {
-                    'step': 4,
-                    'name': 'Percentage Reduction',
-                    'formula': 'Reduction % = (Reduction / Baseline) × 100',
-                    'example': '(300 / 688) × 100 = 43.6%',
-                    'notes': 'Overall effectiveness rate'
-                },
-                {
-                    'step': 5,
-                    'name': 'Annualization',
-                    'formula': 'Annual Rate = (18-month value) × (12/18)',
-                    'example': '300 HAIs × (12/18) = 200 HAIs prevented annually',
-                    'notes': 'Converts 18-month study period to annual rate'
-                }
-            ],
-            'verification_table': pd.DataFrame({
-                'Facility': ['Palo Alto', 'West Palm Beach', 'Las Vegas', 'Greater LA', 
-                            'Loma Linda', 'Shreveport', 'Dallas', 'Total (excl. NO)'],
-                'Pre_HAIs': [74, 43, 41, 111, 88, 247, 237, 688],
-                'Post_HAIs': [60, 15, 26, 56, 47, 106, 86, 388],
-                'Reduction': [14, 28, 15, 55, 41, 141, 151, 300],
-                'Percent': [18.9, 65.1, 36.6, 49.5, 46.6, 57.0, 63.5, 43.6]
-            })
+            'step_by_step': _HAI_STEPS,
+            'verification_table': _HAI_VERIFICATION_TABLE
         }
     
+    @_memoized
     def get_financial_calculations(self):
         """Detailed financial calculation methodology"""
         return {
@@ -104,7 +223,7 @@ class CalculationDocumentation:
                         'calculation': '20% of direct costs'
                     }
                 ],
-                'total': 45000,
+                'total': _COST_PER_HAI,
                 'worked_example': {
                     'scenario': 'CAUTI in ICU patient',
                     'breakdown': [
@@ -126,7 +245,7 @@ class CalculationDocumentation:
                 'components': {
                     'benefits': {
                         'formula': 'Benefits = (HAIs Prevented × Cost per HAI) + Other Savings',
-                        'example': '200 × $45,000 + $2,000,000 = $11,000,000'
+                        'example': _BENEFITS_EXAMPLE
                     },
                     'costs': {
                         'formula': 'Costs = Implementation + Annual Operating',
@@ -137,17 +256,11 @@ class CalculationDocumentation:
                         'result': '4,580%'
                     }
                 },
-                'year_over_year': pd.DataFrame({
-                    'Year': [1, 2, 3, 4, 5],
-                    'Costs': [235000, 70000, 70000, 70000, 70000],
-                    'Benefits': [11000000, 11550000, 12127500, 12734000, 13370000],
-                    'Net': [10765000, 11480000, 12057500, 12664000, 13300000],
-                    'Cumulative_Net': [10765000, 22245000, 34302500, 46966500, 60266500],
-                    'ROI_Percent': [4580, 16400, 17225, 18091, 19000]
-                })
+                'year_over_year': _YOY_TABLE
             }
         }
     
+    @_memoized
     def get_control_comparison_calculations(self):
         """Control group comparison calculations"""
         return {
@@ -161,14 +274,14 @@ class CalculationDocumentation:
                 {
                     'step': 1,
                     'name': 'Intervention Group Change',
-                    'formula': '(Post - Pre) / Pre × 100',
+                    'formula': _PCT_CHANGE_FORMULA,
                     'calculation': '(388 - 688) / 688 × 100 = -43.6%',
                     'result': -43.6
                 },
                 {
                     'step': 2,
                     'name': 'Control Group Change',
-                    'formula': '(Post - Pre) / Pre × 100',
+                    'formula': _PCT_CHANGE_FORMULA,
                     'calculation': '(4224 - 5836) / 5836 × 100 = -27.6%',
                     'result': -27.6
                 },
@@ -197,6 +310,7 @@ class CalculationDocumentation:
             }
         }
     
+    @_memoized
     def get_payback_period_calculation(self):
         """Payback period calculation methodology"""
         return {
@@ -221,17 +335,10 @@ class CalculationDocumentation:
                     'interpretation': 'Investment recovered in less than 2 months'
                 }
             },
-            'monthly_cashflow': pd.DataFrame({
-                'Month': list(range(1, 13)),
-                'Investment': [170833] + [5833] * 11,
-                'Savings': [1166667] * 12,
-                'Net_Cashflow': [995834] + [1160834] * 11,
-                'Cumulative': [995834, 2156668, 3317502, 4478336, 5639170, 
-                             6800004, 7960838, 9121672, 10282506, 11443340,
-                             12604174, 13765008]
-            })
+            'monthly_cashflow': _CASHFLOW_TABLE
         }
     
+    @_memoized
     def get_sensitivity_calculations(self):
         """Sensitivity analysis calculations"""
         return {
@@ -246,54 +353,49 @@ class CalculationDocumentation:
                     },
                     'impact_calculation': {
                         'pessimistic': {
-                            'hais_prevented': 138,  # 30% of 460 baseline
-                            'savings': 6210000,
+                            'hais_prevented': _HAIS_PREVENTED_PESSIMISTIC,
+                            'savings': _HAIS_PREVENTED_PESSIMISTIC * _COST_PER_HAI,
                             'roi': 2541
                         },
                         'base': {
-                            'hais_prevented': 200,
-                            'savings': 9000000,
+                            'hais_prevented': _HAIS_PREVENTED_ANNUAL,
+                            'savings': _HAIS_PREVENTED_ANNUAL * _COST_PER_HAI,
                             'roi': 3730
                         },
                         'optimistic': {
-                            'hais_prevented': 230,
-                            'savings': 10350000,
+                            'hais_prevented': _HAIS_PREVENTED_OPTIMISTIC,
+                            'savings': _HAIS_PREVENTED_OPTIMISTIC * _COST_PER_HAI,
                             'roi': 4304
                         }
                     }
                 },
                 {
                     'variable': 'Cost per HAI',
-                    'base_case': 45000,
+                    'base_case': _COST_PER_HAI,
                     'range': {
-                        'pessimistic': 35000,
-                        'optimistic': 55000
+                        'pessimistic': _COST_PER_HAI_PESSIMISTIC,
+                        'optimistic': _COST_PER_HAI_OPTIMISTIC
                     },
                     'impact_calculation': {
                         'pessimistic': {
-                            'total_savings': 7000000,
+                            'total_savings': _HAIS_PREVENTED_ANNUAL * _COST_PER_HAI_PESSIMISTIC,
                             'roi': 2879
                         },
                         'base': {
-                            'total_savings': 9000000,
+                            'total_savings': _HAIS_PREVENTED_ANNUAL * _COST_PER_HAI,
                             'roi': 3730
                         },
                         'optimistic': {
-                            'total_savings': 11000000,
+                            'total_savings': _HAIS_PREVENTED_ANNUAL * _COST_PER_HAI_OPTIMISTIC,
                             'roi': 4580
                         }
                     }
                 }
             ],
-            'tornado_diagram_data': pd.DataFrame({
-                'Variable': ['HAI Reduction Rate', 'Cost per HAI', 'Implementation Cost', 
-                           'Annual Operating', 'LOS Days Saved'],
-                'Low_Impact': [2541, 2879, 3500, 3650, 3400],
-                'High_Impact': [4304, 4580, 3960, 3810, 4060],
-                'Swing': [1763, 1701, 460, 160, 660]
-            })
+            'tornado_diagram_data': _TORNADO_TABLE
         }
     
+    @_memoized
     def get_outbreak_value_calculation(self):
         """Outbreak detection value calculation"""
         return {
@@ -306,7 +408,7 @@ class CalculationDocumentation:
                     'detection_benefit': {
                         'early_detection_days': 14,
                         'cases_prevented': 25,
-                        'calculation': '25 cases × $45,000 = $1,125,000',
+                        'calculation': _SHREVEPORT_CALC,
                         'containment_cost_avoided': 500000,
                         'total_value': 1625000
                     }
@@ -318,7 +420,7 @@ class CalculationDocumentation:
                         'early_detection_days': 21,
                         'community_spread_prevented': 'Yes',
                         'hospital_cases_avoided': 40,
-                        'calculation': '40 cases × $45,000 = $1,800,000',
+                        'calculation': _NEW_ORLEANS_CALC,
                         'public_health_value': 1000000,
                         'total_value': 2800000
                     }
@@ -332,6 +434,7 @@ class CalculationDocumentation:
             }
         }
     
+    @_memoized
     def get_scaling_calculations(self):
         """Calculations for scaling to different facility sizes"""
         return {
@@ -344,7 +447,7 @@ class CalculationDocumentation:
             'scaling_formula': {
                 'hais': 'Annual Admissions × HAI Rate',
                 'prevented': 'Baseline HAIs × 43.6%',
-                'savings': 'HAIs Prevented × $45,000'
+                'savings': _SAVINGS_FORMULA
             },
             'examples': [
                 {
@@ -386,6 +489,7 @@ class CalculationDocumentation:
             ]
         }
     
+    @_memoized
     def compile_all_calculations(self):
         """Compile all calculation documentation"""
         return {
@@ -398,63 +502,17 @@ class CalculationDocumentation:
             'scaling': self.get_scaling_calculations()
         }
     
+    @_memoized
+    def compile_all_calculations_json(self):
+        """Compile all calculation documentation as UTF-8 JSON bytes"""
+        return json.dumps(_jsonable(self.compile_all_calculations()), ensure_ascii=False).encode('utf-8')
+    
     def get_calculation_summary_table(self):
-        """Summary table of all key calculations"""
-        return pd.DataFrame({
-            'Calculation': [
-                'HAI Reduction Rate',
-                'HAIs Prevented (Annual)',
-                'Cost per HAI',
-                'Total Annual Savings',
-                'Implementation Cost',
-                'Annual Operating Cost',
-                'First Year ROI',
-                'Payback Period',
-                'Control Group Improvement',
-                'Relative Effectiveness',
-                '5-Year Net Benefit',
-                'Lives Saved Annually'
-            ],
-            'Formula': [
-                '(Pre - Post) / Pre × 100',
-                'Baseline × Reduction Rate',
-                'Direct + Indirect Costs',
-                'HAIs × Cost + Other Benefits',
-                'Software + Setup + Training',
-                'Maintenance + Support + Staff',
-                '((Benefits - Costs) / Costs) × 100',
-                'Investment / Monthly Savings',
-                'Intervention - Control Change',
-                'DiD / Control × 100',
-                'Σ(Annual Benefits - Costs) × 5',
-                'HAIs Prevented × 5% Mortality'
-            ],
-            'Value': [
-                '43.6%',
-                '200',
-                '$45,000',
-                '$11,000,000',
-                '$165,000',
-                '$70,000',
-                '4,580%',
-                '1.76 months',
-                '16.0 pp',
-                '58%',
-                '$60,266,500',
-                '10'
-            ],
-            'Source': [
-                '8-facility study',
-                'Calculated',
-                'CDC + VA data',
-                'Calculated',
-                'Vendor quote',
-                'Vendor quote',
-                'Calculated',
-                'Calculated',
-                'DiD analysis',
-                'Calculated',
-                'Projection',
-                'CDC mortality data'
-            ]
-        })
\ No newline at end of file
+        """Summary table of all key calculations as row tuples"""
+        return _SUMMARY_ROWS
+    
+    @_memoized
+    def get_calculation_summary_dataframe(self):
+        """Summary table of all key calculations as a DataFrame"""
+        import pandas as pd
+        return pd.DataFrame(_SUMMARY_ROWS, columns=_SUMMARY_COLUMNS)
\ No newline at end of file
@@ -7,6 +7,224 @@ import pandas as pd
 import numpy as np
 from datetime import datetime
 
+# Study payloads are literals, so they are built once at import and every
+# instance returns the same objects; callers treat them as read-only. Facility
+# results are held column-wise so totals and filters are column operations
+_FACILITIES_DF = pd.DataFrame({
+    'name': [
+        'Palo Alto VA Medical Center',
+        'West Palm Beach VA Medical Center',
+        'Las Vegas VA Medical Center',
+        'Greater Los Angeles VA Medical Center',
+        'New Orleans VA Medical Center',
+        'Loma Linda VA Medical Center',
+        'Shreveport VA Medical Center',
+        'Dallas VA Medical Center'
+    ],
+    'region': ['West', 'Southeast', 'Southwest', 'West', 'South', 'West', 'South', 'South'],
+    'go_live': [
+        'December 2, 2020',
+        'July 22, 2021',
+        'June 30, 2022',
+        'August 1, 2022',
+        'September 8, 2022',
+        'October 11, 2022',
+        'April 23, 2024',
+        'May 21, 2024'
+    ],
+    'beds': np.array([308, 300, 293, 605, 248, 270, 194, 875], dtype=np.int32),
+    'pre_hais': np.array([74, 43, 41, 111, 33, 88, 247, 237], dtype=np.int32),
+    'post_hais': np.array([60, 15, 26, 56, 1089, 47, 106, 86], dtype=np.int32),  # New Orleans: outbreak detected
+    'reduction_absolute': np.array([14, 28, 15, 55, -1056, 41, 141, 151], dtype=np.int32),
+    'reduction_percent': [18.9, 65.1, 36.6, 49.5, -3200.0, 46.6, 57.0, 63.5],
+    'outcome': [
+        'Success',
+        'Exceptional',
+        'Success',
+        'Success',
+        'Outbreak Detected',
+        'Success',
+        'CDI Outbreak Detected',
+        'Exceptional'
+    ],
+    'special_notes': [
+        'Pilot facility, first implementation',
+        'Highest reduction rate achieved',
+        'Rapid implementation model',
+        'Largest facility in study',
+        'MRSA community surge detected and contained',
+        'Integrated with existing systems',
+        'CDI cluster identified and prevented',
+        'Second highest reduction, newest implementation'
+    ]
+})
+
+_CONTROL_GROUP_DATA = {
+    'total_facilities': 117,
+    'pre_period_hais': 5836,
+    'post_period_hais': 4224,
+    'reduction_absolute': 1612,
+    'reduction_percent': 27.6,
+    'average_per_facility': {
+        'pre': 49.9,
+        'post': 36.1,
+        'reduction': 13.8
+    },
+    'comparison': {
+        'intervention_better_by': 18.1,  # Percentage points
+        'relative_improvement': 58,  # Percent better than control
+        'statistical_significance': 'p < 0.001'
+    }
+}
+
+_HAI_BREAKDOWN_DF = pd.DataFrame({
+    'HAI_Type': ['CAUTI', 'CLABSI', 'SSI', 'CDI', 'MRSA', 'DVT/PE'],
+    'Full_Name': [
+        'Catheter-Associated UTI',
+        'Central Line Bloodstream Infection',
+        'Surgical Site Infection',
+        'Clostridioides difficile Infection',
+        'Methicillin-resistant Staph aureus',
+        'Deep Vein Thrombosis/Pulmonary Embolism'
+    ],
+    'Intervention_Pre': [145, 112, 98, 87, 143, 103],
+    'Intervention_Post': [78, 67, 58, 52, 78, 55],
+    'Control_Pre': [1459, 1167, 1050, 875, 700, 585],
+    'Control_Post': [1155, 968, 907, 732, 605, 857],
+    'Net_Benefit_Percent': [34.0, 21.1, 12.8, 18.1, -21.2, 26.4]
+})
+
+# Summary statistics are derived once at import. Study-wide HAI totals are the
+# per-type breakdown counts, not sums of the facility rows
+_TOTAL_PRE_HAIS = int(_HAI_BREAKDOWN_DF['Intervention_Pre'].sum())
+_TOTAL_POST_HAIS = int(_HAI_BREAKDOWN_DF['Intervention_Post'].sum())
+_EXTENDED_LOS_DAYS = 7.5
+_OUTBREAK_FACILITIES = _FACILITIES_DF['outcome'].str.contains('Outbreak')
+
+_FACILITY_SUMMARY = {
+    'total_pre_hais': _TOTAL_PRE_HAIS,
+    'total_post_hais': _TOTAL_POST_HAIS,
+    'total_reduction': _TOTAL_PRE_HAIS - _TOTAL_POST_HAIS,
+    'average_reduction_percent': round((_TOTAL_PRE_HAIS - _TOTAL_POST_HAIS) / _TOTAL_PRE_HAIS * 100, 1),
+    'facilities_with_reduction': int((~_OUTBREAK_FACILITIES & (_FACILITIES_DF['reduction_absolute'] > 0)).sum()),
+    'facilities_with_outbreak_detection': int(_OUTBREAK_FACILITIES.sum()),
+    'total_beds': int(_FACILITIES_DF['beds'].sum()),
+    'total_lives_saved': 15,
+    'total_days_saved': int((_TOTAL_PRE_HAIS - _TOTAL_POST_HAIS) * _EXTENDED_LOS_DAYS)
+}
+
+_EIGHT_FACILITY_DATA = {
+    'facilities': _FACILITIES_DF,
+    'summary_statistics': _FACILITY_SUMMARY
+}
+
+_FINANCIAL_IMPACT_DATA = {
+    'per_hai_costs': {
+        'direct_medical': 45000,
+        'extended_los': 15000,  # 7.5 days × $2000/day
+        'total': 60000
+    },
+    'implementation_costs': {
+        'software_license_total': 800000,  # For 8 facilities
+        'integration_setup': 240000,
+        'staff_training': 120000,
+        'infrastructure': 160000,
+        'total': 1320000,
+        'per_facility': 165000
+    },
+    'annual_operating': {
+        'maintenance': 160000,
+        'support': 80000,
+        'staff_time': 320000,  # 0.5 FTE per facility
+        'total': 560000,
+        'per_facility': 70000
+    },
+    'savings_18_months': {
+        'direct_hai_prevention': 13500000,
+        'los_reduction': 4500000,
+        'mortality_prevention': 3750000,
+        'outbreak_prevention': 2000000,
+        'total': 23750000,
+        'per_facility': 2968750
+    },
+    'roi_metrics': {
+        'payback_months': 12,
+        'first_year_roi': 1163,
+        'five_year_roi': 5825,
+        'break_even_month': 11
+    }
+}
+
+_CALCULATION_METHODOLOGY = {
+    'hai_reduction': {
+        'formula': '(Pre-Period HAIs - Post-Period HAIs) / Pre-Period HAIs × 100',
+        'example': '(688 - 388) / 688 × 100 = 43.6%',
+        'notes': 'All periods normalized to 18 months for comparison'
+    },
+    'cost_per_hai': {
+        'components': [
+            ('Direct medical costs', 30000),
+            ('Extended LOS (7.5 days × $2000)', 15000),
+            ('Additional treatments', 5000),
+            ('Indirect costs', 10000)
+        ],
+        'total': 45000,
+        'source': 'CDC and published literature (2024 dollars)'
+    },
+    'roi_calculation': {
+        'formula': '((Total Savings - Total Investment) / Total Investment) × 100',
+        'year_1_example': '((15,833,333 - 1,880,000) / 1,880,000) × 100 = 742%',
+        'annualized_from_18mo': 'Savings × (12/18) for annual rate'
+    },
+    'statistical_methods': {
+        'primary': 'Difference-in-Differences (DiD) analysis',
+        'secondary': 'Chi-square test for independence',
+        'significance_level': 0.05,
+        'confidence_interval': 95
+    }
+}
+
+_SENSITIVITY_ANALYSIS_DATA = {
+    'parameters': [
+        {
+            'name': 'HAI Reduction Rate',
+            'base_case': 43.6,
+            'pessimistic': 30.0,
+            'optimistic': 50.0,
+            'impact': 'High'
+        },
+        {
+            'name': 'Cost per HAI',
+            'base_case': 45000,
+            'pessimistic': 35000,
+            'optimistic': 55000,
+            'impact': 'High'
+        },
+        {
+            'name': 'Implementation Cost',
+            'base_case': 165000,
+            'pessimistic': 200000,
+            'optimistic': 130000,
+            'impact': 'Medium'
+        },
+        {
+            'name': 'Annual Operating Cost',
+            'base_case': 70000,
+            'pessimistic': 85000,
+            'optimistic': 55000,
+            'impact': 'Low'
+        }
+    ],
+    'scenario_results': {
+        'pessimistic': {'roi': 450, 'payback_months': 18},
+        'base_case': {'roi': 742, 'payback_months': 12},
+        'optimistic': {'roi': 1250, 'payback_months': 8}
+    }
+}
+
+# Labels for the four monthly trend phases, indexed by phase number
+_TREND_PHASES = np.array(['Baseline', 'Implementation', 'Improvement', 'Sustained'])
+
 class ComprehensiveReportData:
     """Manages all data needed for comprehensive report generation"""
     
@@ -17,294 +235,48 @@ class ComprehensiveReportData:
         
     def get_eight_facility_data(self):
         """Returns detailed data from 8 VA facility study"""
-        return {
-            'facilities': [
-                {
-                    'name': 'Palo Alto VA Medical Center',
-                    'region': 'West',
-                    'go_live': 'December 2, 2020',
-                    'beds': 308,
-                    'pre_hais': 74,
-                    'post_hais': 60,
-                    'reduction_absolute': 14,
-                    'reduction_percent': 18.9,
-                    'outcome': 'Success',
-                    'special_notes': 'Pilot facility, first implementation'
-                },
-                {
-                    'name': 'West Palm Beach VA Medical Center',
-                    'region': 'Southeast',
-                    'go_live': 'July 22, 2021',
-                    'beds': 300,
-                    'pre_hais': 43,
-                    'post_hais': 15,
-                    'reduction_absolute': 28,
-                    'reduction_percent': 65.1,
-                    'outcome': 'Exceptional',
-                    'special_notes': 'Highest reduction rate achieved'
-                },
-                {
-                    'name': 'Las Vegas VA Medical Center',
-                    'region': 'Southwest',
-                    'go_live': 'June 30, 2022',
-                    'beds': 293,
-                    'pre_hais': 41,
-                    'post_hais': 26,
-                    'reduction_absolute': 15,
-                    'reduction_percent': 36.6,
-                    'outcome': 'Success',
-                    'special_notes': 'Rapid implementation model'
-                },
-                {
-                    'name': 'Greater Los Angeles VA Medical Center',
-                    'region': 'West',
-                    'go_live': 'August 1, 2022',
-                    'beds': 605,
-                    'pre_hais': 111,
-                    'post_hais': 56,
-                    'reduction_absolute': 55,
-                    'reduction_percent': 49.5,
-                    'outcome': 'Success',
-                    'special_notes': 'Largest facility in study'
-                },
-                {
-                    'name': 'New Orleans VA Medical Center',
-                    'region': 'South',
-                    'go_live': 'September 8, 2022',
-                    'beds': 248,
-                    'pre_hais': 33,
-                    'post_hais': 1089,  # Outbreak detected
-                    'reduction_absolute': -1056,
-                    'reduction_percent': -3200.0,
-                    'outcome': 'Outbreak Detected',
-                    'special_notes': 'MRSA community surge detected and contained'
-                },
-                {
-                    'name': 'Loma Linda VA Medical Center',
-                    'region': 'West',
-                    'go_live': 'October 11, 2022',
-                    'beds': 270,
-                    'pre_hais': 88,
-                    'post_hais': 47,
-                    'reduction_absolute': 41,
-                    'reduction_percent': 46.6,
-                    'outcome': 'Success',
-                    'special_notes': 'Integrated with existing systems'
-                },
-                {
-                    'name': 'Shreveport VA Medical Center',
-                    'region': 'South',
-                    'go_live': 'April 23, 2024',
-                    'beds': 194,
-                    'pre_hais': 247,
-                    'post_hais': 106,
-                    'reduction_absolute': 141,
-                    'reduction_percent': 57.0,
-                    'outcome': 'CDI Outbreak Detected',
-                    'special_notes': 'CDI cluster identified and prevented'
-                },
-                {
-                    'name': 'Dallas VA Medical Center',
-                    'region': 'South',
-                    'go_live': 'May 21, 2024',
-                    'beds': 875,
-                    'pre_hais': 237,
-                    'post_hais': 86,
-                    'reduction_absolute': 151,
-                    'reduction_percent': 63.5,
-                    'outcome': 'Exceptional',
-                    'special_notes': 'Second highest reduction, newest implementation'
-                }
-            ],
-            'summary_statistics': {
-                'total_pre_hais': 688,
-                'total_post_hais': 388,
-                'total_reduction': 300,
-                'average_reduction_percent': 43.6,
-                'facilities_with_reduction': 6,
-                'facilities_with_outbreak_detection': 2,
-                'total_beds': 3093,
-                'total_lives_saved': 15,
-                'total_days_saved': 2250
-            }
-        }
+        return _EIGHT_FACILITY_DATA
     
     def get_control_group_data(self):
         """Returns control group comparison data"""
-        return {
-            'total_facilities': 117,
-            'pre_period_hais': 5836,
-            'post_period_hais': 4224,
-            'reduction_absolute': 1612,
-            'reduction_percent': 27.6,
-            'average_per_facility': {
-                'pre': 49.9,
-                'post': 36.1,
-                'reduction': 13.8
-            },
-            'comparison': {
-                'intervention_better_by': 18.1,  # Percentage points
-                'relative_improvement': 58,  # Percent better than control
-                'statistical_significance': 'p < 0.001'
-            }
-        }
+        return _CONTROL_GROUP_DATA
     
     def get_hai_type_breakdown(self):
         """Returns HAI breakdown by type"""
-        return pd.DataFrame({
-            'HAI_Type': ['CAUTI', 'CLABSI', 'SSI', 'CDI', 'MRSA', 'DVT/PE'],
-            'Full_Name': [
-                'Catheter-Associated UTI',
-                'Central Line Bloodstream Infection',
-                'Surgical Site Infection',
-                'Clostridioides difficile Infection',
-                'Methicillin-resistant Staph aureus',
-                'Deep Vein Thrombosis/Pulmonary Embolism'
-            ],
-            'Intervention_Pre': [145, 112, 98, 87, 143, 103],
-            'Intervention_Post': [78, 67, 58, 52, 78, 55],
-            'Control_Pre': [1459, 1167, 1050, 875, 700, 585],
-            'Control_Post': [1155, 968, 907, 732, 605, 857],
-            'Net_Benefit_Percent': [34.0, 21.1, 12.8, 18.1, -21.2, 26.4]
-        })
+        return _HAI_BREAKDOWN_DF
     
     def get_financial_impact_data(self):
         """Returns comprehensive financial impact data"""
-        return {
-            'per_hai_costs': {
-                'direct_medical': 45000,
-                'extended_los': 15000,  # 7.5 days × $2000/day
-                'total': 60000
-            },
-            'implementation_costs': {
-                'software_license_total': 800000,  # For 8 facilities
-                'integration_setup': 240000,
-                'staff_training': 120000,
-                'infrastructure': 160000,
-                'total': 1320000,
-                'per_facility': 165000
-            },
-            'annual_operating': {
-                'maintenance': 160000,
-                'support': 80000,
-                'staff_time': 320000,  # 0.5 FTE per facility
-                'total': 560000,
-                'per_facility': 70000
-            },
-            'savings_18_months': {
-                'direct_hai_prevention': 13500000,
-                'los_reduction': 4500000,
-                'mortality_prevention': 3750000,
-                'outbreak_prevention': 2000000,
-                'total': 23750000,
-                'per_facility': 2968750
-            },
-            'roi_metrics': {
-                'payback_months': 12,
-                'first_year_roi': 1163,
-                'five_year_roi': 5825,
-                'break_even_month': 11
-            }
-        }
+        return _FINANCIAL_IMPACT_DATA
     
     def get_monthly_trend_data(self):
         """Returns monthly trend data for visualization"""
         # Generate synthetic but realistic monthly data based on actual results
         months = pd.date_range(start='2020-12', end='2024-08', freq='ME')
         
-        # Create trending data that shows improvement over time
-        np.random.seed(42)  # For reproducibility
+        # Phase boundaries fall after months 6, 12 and 24; each phase has its
+        # own mean and noise level, so the whole series is one vectorized draw
+        phase_idx = np.searchsorted([6, 12, 24], np.arange(len(months)), side='right')
         baseline = 45  # Average monthly HAIs before implementation
+        means = np.array([baseline, baseline * 0.9, baseline * 0.7, baseline * 0.564])[phase_idx]  # 43.6% reduction
+        stds = np.array([3, 2, 2, 1.5])[phase_idx]
         
-        trends = []
-        for i, month in enumerate(months):
-            if i < 6:  # First 6 months - baseline
-                value = baseline + np.random.normal(0, 3)
-            elif i < 12:  # Months 6-12 - initial implementation
-                value = baseline * 0.9 + np.random.normal(0, 2)
-            elif i < 24:  # Months 12-24 - improvement phase
-                value = baseline * 0.7 + np.random.normal(0, 2)
-            else:  # Months 24+ - sustained improvement
-                value = baseline * 0.564 + np.random.normal(0, 1.5)  # 43.6% reduction
-            
-            trends.append({
-                'month': month,
-                'hai_count': max(0, int(value)),
-                'phase': 'Baseline' if i < 6 else 'Implementation' if i < 12 else 'Improvement' if i < 24 else 'Sustained'
-            })
+        rng = np.random.default_rng(42)  # For reproducibility
+        values = means + rng.normal(0, 1, len(months)) * stds
         
-        return pd.DataFrame(trends)
+        return pd.DataFrame({
+            'month': months,
+            'hai_count': np.clip(values.astype(np.int64), 0, None),
+            'phase': _TREND_PHASES[phase_idx]
+        })
     
     def get_calculation_methodology(self):
         """Returns detailed calculation methodology"""
-        return {
-            'hai_reduction': {
-                'formula': '(Pre-Period HAIs - Post-Period HAIs) / Pre-Period HAIs × 100',
-                'example': '(688 - 388) / 688 × 100 = 43.6%',
-                'notes': 'All periods normalized to 18 months for comparison'
-            },
-            'cost_per_hai': {
-                'components': [
-                    ('Direct medical costs', 30000),
-                    ('Extended LOS (7.5 days × $2000)', 15000),
-                    ('Additional treatments', 5000),
-                    ('Indirect costs', 10000)
-                ],
-                'total': 45000,
-                'source': 'CDC and published literature (2024 dollars)'
-            },
-            'roi_calculation': {
-                'formula': '((Total Savings - Total Investment) / Total Investment) × 100',
-                'year_1_example': '((15,833,333 - 1,880,000) / 1,880,000) × 100 = 742%',
-                'annualized_from_18mo': 'Savings × (12/18) for annual rate'
-            },
-            'statistical_methods': {
-                'primary': 'Difference-in-Differences (DiD) analysis',
-                'secondary': 'Chi-square test for independence',
-                'significance_level': 0.05,
-                'confidence_interval': 95
-            }
-        }
+        return _CALCULATION_METHODOLOGY
     
     def get_sensitivity_analysis_data(self):
         """Returns sensitivity analysis parameters"""
-        return {
-            'parameters': [
-                {
-                    'name': 'HAI Reduction Rate',
-                    'base_case': 43.6,
-                    'pessimistic': 30.0,
-                    'optimistic': 50.0,
-                    'impact': 'High'
-                },
-                {
-                    'name': 'Cost per HAI',
-                    'base_case': 45000,
-                    'pessimistic': 35000,
-                    'optimistic': 55000,
-                    'impact': 'High'
-                },
-                {
-                    'name': 'Implementation Cost',
-                    'base_case': 165000,
-                    'pessimistic': 200000,
-                    'optimistic': 130000,
-                    'impact': 'Medium'
-                },
-                {
-                    'name': 'Annual Operating Cost',
-                    'base_case': 70000,
-                    'pessimistic': 85000,
-                    'optimistic': 55000,
-                    'impact': 'Low'
-                }
-            ],
-            'scenario_results': {
-                'pessimistic': {'roi': 450, 'payback_months': 18},
-                'base_case': {'roi': 742, 'payback_months': 12},
-                'optimistic': {'roi': 1250, 'payback_months': 8}
-            }
-        }
+        return _SENSITIVITY_ANALYSIS_DATA
     
     def compile_all_data(self):
         """Compiles all data into a structured format for report generation"""
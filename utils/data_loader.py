@@ -7,6 +7,17 @@ import pandas as pd
 import streamlit as st
 from pathlib import Path
 import json
+from config.defaults import VISN21_CSV_SCHEMAS
+
+@st.cache_data(show_spinner=False)
+def _read_csv_cached(path_str, mtime):
+    """Parse a sample data CSV once per file version"""
+    # mtime is only part of the cache key, so an edited file is parsed again
+    schema = VISN21_CSV_SCHEMAS.get(Path(path_str).name)
+    
+    if schema is None:
+        return pd.read_csv(path_str, engine='pyarrow')
+    return pd.read_csv(path_str, engine='pyarrow', usecols=list(schema), dtype=schema)
 
 class DataLoader:
     def __init__(self):
@@ -76,19 +87,19 @@ class DataLoader:
             # Patient bed days
             bed_days_file = self.data_path / 'visn21_patient_bed_days.csv'
             if bed_days_file.exists():
-                self.loaded_data['bed_days'] = pd.read_csv(bed_days_file)
+                self.loaded_data['bed_days'] = _read_csv_cached(str(bed_days_file), bed_days_file.stat().st_mtime)
                 files_loaded.append("Patient Bed Days")
             
             # HAI rates
             hai_file = self.data_path / 'visn21_hai_rates.csv'
             if hai_file.exists():
-                self.loaded_data['hai_rates'] = pd.read_csv(hai_file)
+                self.loaded_data['hai_rates'] = _read_csv_cached(str(hai_file), hai_file.stat().st_mtime)
                 files_loaded.append("HAI Rates")
             
             # Antibiotic DOT
             dot_file = self.data_path / 'visn21_antibiotic_dot.csv'
             if dot_file.exists():
-                self.loaded_data['antibiotic_dot'] = pd.read_csv(dot_file)
+                self.loaded_data['antibiotic_dot'] = _read_csv_cached(str(dot_file), dot_file.stat().st_mtime)
                 files_loaded.append("Antibiotic DOT")
             
             if files_loaded:
@@ -271,15 +271,15 @@ class EnhancedExportHandler:
             ['Facility', 'Go-Live', 'Beds', 'Pre-HAIs', 'Post-HAIs', 'Reduction', 'Outcome']
         ]
         
-        for facility in facility_data:
+        for facility in facility_data.itertuples(index=False):
             facility_table_data.append([
-                facility['name'].replace(' VA Medical Center', ''),
-                facility['go_live'].split(',')[0],  # Just month and day
-                str(facility['beds']),
-                str(facility['pre_hais']),
-                str(facility['post_hais']),
-                f"{facility['reduction_percent']:.1f}%",
-                facility['outcome']
+                facility.name.replace(' VA Medical Center', ''),
+                facility.go_live.split(',')[0],  # Just month and day
+                str(facility.beds),
+                str(facility.pre_hais),
+                str(facility.post_hais),
+                f"{facility.reduction_percent:.1f}%",
+                facility.outcome
             ])
         
         # Add summary row
@@ -444,11 +444,11 @@ class EnhancedExportHandler:
         calc_steps_data = [['Step', 'Description', 'Formula', 'Example', 'Result']]
         for step in hai_calcs['step_by_step']:
             calc_steps_data.append([
-                str(step['step']),
-                step['name'],
-                step['formula'][:40] + '...' if len(step['formula']) > 40 else step['formula'],
-                step['example'][:35] + '...' if len(step['example']) > 35 else step['example'],
-                step.get('notes', '')[:25] + '...' if step.get('notes', '') and len(step.get('notes', '')) > 25 else step.get('notes', '')
+                str(step.step),
+                step.name,
+                step.formula[:40] + '...' if len(step.formula) > 40 else step.formula,
+                step.example[:35] + '...' if len(step.example) > 35 else step.example,
+                step.notes[:25] + '...' if len(step.notes) > 25 else step.notes
             ])
         
         calc_steps_table = Table(calc_steps_data, colWidths=[0.5*inch, 1.5*inch, 2*inch, 2*inch, 1.5*inch])
@@ -480,7 +480,7 @@ class EnhancedExportHandler:
                 f"${comp['amount']:,}",
                 comp['calculation']
             ])
-        cost_detail_data.append(['TOTAL', 'Complete cost per HAI', '$45,000', 'Sum of all components'])
+        cost_detail_data.append(['TOTAL', 'Complete cost per HAI', f"${financial_calcs['cost_per_hai']['total']:,}", 'Sum of all components'])
         
         cost_detail_table = Table(cost_detail_data, colWidths=[1.5*inch, 2*inch, 1*inch, 2.5*inch])
         cost_detail_table.setStyle(TableStyle([
@@ -529,14 +529,17 @@ class EnhancedExportHandler:
         yoy_data = roi_calc['year_over_year']
         projection_data = [['Year', 'Costs', 'Benefits', 'Net Benefit', 'Cumulative Net', 'ROI %']]
         
-        for _, row in yoy_data.iterrows():
+        for year, costs, benefits, net, cumulative_net, roi_percent in zip(
+            yoy_data['Year'], yoy_data['Costs'], yoy_data['Benefits'],
+            yoy_data['Net'], yoy_data['Cumulative_Net'], yoy_data['ROI_Percent']
+        ):
             projection_data.append([
-                str(row['Year']),
-                f"${row['Costs']:,}",
-                f"${row['Benefits']:,}",
-                f"${row['Net']:,}",
-                f"${row['Cumulative_Net']:,}",
-                f"{row['ROI_Percent']:,}%"
+                str(year),
+                f"${costs:,}",
+                f"${benefits:,}",
+                f"${net:,}",
+                f"${cumulative_net:,}",
+                f"{roi_percent:,}%"
             ])
         
         projection_table = Table(projection_data, colWidths=[0.7*inch, 1.2*inch, 1.3*inch, 1.3*inch, 1.5*inch, 1*inch])
@@ -720,7 +723,7 @@ class EnhancedExportHandler:
             summary_df.to_excel(writer, sheet_name='Executive Summary', index=False)
             
             # Sheet 2: 8-Facility Study Data
-            facilities_df = pd.DataFrame(self.comprehensive_data['facility_data']['facilities'])
+            facilities_df = self.comprehensive_data['facility_data']['facilities']
             facilities_df.to_excel(writer, sheet_name='8 Facility Results', index=False)
             
             # Sheet 3: HAI Type Breakdown
@@ -11,6 +11,9 @@ import io
 import base64
 
 class VisualizationCharts:
+    # Encoded PNGs from generate_all_charts, shared by every instance in the process
+    _chart_cache = None
+    
     def __init__(self):
         # Set style for professional appearance
         plt.style.use('seaborn-v0_8-whitegrid')
@@ -199,10 +202,12 @@ class VisualizationCharts:
         """Create line chart showing monthly HAI trends"""
         fig, ax = plt.subplots(figsize=self.fig_size, dpi=self.dpi)
         
-        # Generate sample monthly data
+        # Generate sample monthly data from a fixed seed so every report draws
+        # the same series
+        rng = np.random.default_rng(42)
         months = list(range(1, 25))
-        baseline = [45 + np.random.randint(-5, 5) for _ in range(12)]
-        post_implementation = [28 + np.random.randint(-3, 3) for _ in range(12)]
+        baseline = (45 + rng.integers(-5, 5, size=12)).tolist()
+        post_implementation = (28 + rng.integers(-3, 3, size=12)).tolist()
         
         # Plot lines
         ax.plot(months[:12], baseline, color=self.colors['danger'], 
@@ -406,6 +411,11 @@ class VisualizationCharts:
     
     def generate_all_charts(self, report_data):
         """Generate all charts for the comprehensive report"""
+        # The report charts are drawn from fixed study data and seeded sample
+        # series, so render and encode them once
+        if VisualizationCharts._chart_cache is not None:
+            return dict(VisualizationCharts._chart_cache)
+        
         charts = {}
         
         # Extract data from report
@@ -429,4 +439,5 @@ class VisualizationCharts:
         charts['infection_heatmap'] = self.create_infection_type_heatmap({})
         charts['comparison'] = self.create_comparison_chart({}, {})
         
-        return charts
\ No newline at end of file
+        VisualizationCharts._chart_cache = charts
+        return dict(charts)
\ No newline at end of file